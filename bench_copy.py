@@ -0,0 +1,46 @@
+import timeit
+import dataclasses
+import copy as stdlib_copy
+import typing as tp
+
+import utils
+
+
+def bench_copy(target, number: int = 1000) -> tp.Dict[str, float]:
+    """Seconds taken to copy target `number` times, by `utils.copy` and deepcopy."""
+    return {
+        "utils.copy": timeit.timeit(
+            lambda: utils.copy(target=target), number=number
+        ),
+        "copy.deepcopy": timeit.timeit(
+            lambda: stdlib_copy.deepcopy(target), number=number
+        ),
+    }
+
+
+@dataclasses.dataclass
+class Node:
+    name: str
+    parent: tp.Optional["Node"]
+    children: tp.List["Node"] = dataclasses.field(default_factory=list)
+    tags: tp.Dict[str, tp.Tuple[int, int]] = dataclasses.field(
+        default_factory=dict
+    )
+
+
+def sample_tree() -> Node:
+    root = Node("root", None)
+
+    for i in range(100):
+        child = Node(f"child{i}", root, tags={"pos": (i, i)})
+        child.children.extend(Node(f"leaf{j}", child) for j in range(10))
+        root.children.append(child)
+
+    return root
+
+
+if __name__ == "__main__":
+    number = 100
+
+    for name, seconds in bench_copy(sample_tree(), number=number).items():
+        print(f"{name:<15} {seconds / number * 1000:8.3f}ms per copy")
@@ -1,35 +1,58 @@
 import io
-import collections
+import heapq
 import itertools
 
 import typing as tp
 
+import utils
 
-def solve(inputs: tp.List[io.TextIOBase]):
-    answers = []
 
-    for input in inputs:
-        elves_calories = collections.deque()
-        elves_calories.append([])
+def top_calories(input: io.TextIOBase, count: int = 3) -> tp.List[int]:
+    """
+    Greatest totals of calories per elve, greatest first.
+    Lines are folded as read, and only `count` totals are kept in a min-heap.
+    """
+    top = []
+
+    def push(total: int):
+        if len(top) < count:
+            heapq.heappush(top, total)
+        else:
+            heapq.heappushpop(top, total)
+
+    total, in_block = 0, False
+    for line in input:
+        if line.isspace():
+            if in_block:
+                push(total)
+            total, in_block = 0, False
+        else:
+            total += int(line)
+            in_block = True
+
+    if in_block:
+        push(total)
+
+    return sorted(top, reverse=True)
 
-        line = input.readline()
-        while line:
-            if line == "\n":
-                elves_calories.append([])
-            else:
-                elves_calories[-1].append(int(line.rstrip("\n")))
 
-            #
-            line = input.readline()
+def top_calories_bulk(input: io.TextIOBase, count: int = 3) -> tp.List[int]:
+    """Same as `top_calories`, but reading the whole input at once."""
+    return heapq.nlargest(count, map(sum, utils.read_blocks(input)))
 
-        # calculate maximums
-        elves_sum_calories = (sum(calories) for calories in elves_calories)
-        maximums = sorted(enumerate(elves_sum_calories), key=(lambda p: p[1]), reverse=True)
 
-        answers.append(maximums)
+def parse(input: io.TextIOBase) -> tp.List[int]:
+    return top_calories(input, 3)
+
+
+def solve(inputs: tp.List[io.TextIOBase]):
+    answers = []
+
+    for input in inputs:
+        answers.append(utils.parse_once(input, parse))
 
-    yield answers[0][0][1], None
-    yield sum(calories for _, calories in itertools.islice(answers[1], 3)), None
+    yield answers[0][0], None
+    yield sum(answers[1][:3]), None
 
 
 def solve_golf(inputs: tp.List[io.TextIOBase]):
@@ -1,10 +1,13 @@
 import io
 import enum
 import itertools
+import operator
 import dataclasses
 
 import typing as tp
 
+import utils
+
 
 class Outcomes:  # (enum.Enum):
     @dataclasses.dataclass
@@ -101,44 +104,52 @@ class Choices:  # (enum.Enum):
         return iter([cls.ROCK, cls.PAPER, cls.SCISSORS])
 
 
-def solve(inputs: tp.List[io.TextIOBase]):
-    answers = []
+def _line_scores() -> tp.Dict[bytes, tp.Tuple[int, int]]:
+    """Both scores of each of the 9 possible lines of a guide."""
+    table = {}
 
-    for input in inputs:
-        our_score = 0
-        secret_score = 0
-
-        line = input.readline()
-        while line:
-            elve_letter, our_letter = line.rstrip("\n").partition(" ")[::2]
-            elve_choice = next(
-                choice
-                for choice in Choices.__iter__()
-                if choice.elve == elve_letter
-            )
+    for elve_choice in Choices.__iter__():
+        for our_choice, outcome in zip(Choices.__iter__(), Outcomes.__iter__()):
+            assert our_choice.our == outcome.symbol
+
+            our_score = our_choice.against(elve_choice).score + our_choice.score
+            secret_score = outcome.score + elve_choice.fulfill(outcome).score
+
+            line = f"{elve_choice.elve} {our_choice.our}".encode()
+            table[line] = (our_score, secret_score)
+
+    return table
+
+
+LINE_SCORES = _line_scores()
 
-            #
-            our_choice = next(
-                choice for choice in Choices.__iter__() if choice.our == our_letter
-            )
-            outcome = our_choice.against(elve_choice)
-            play_score = outcome.score + our_choice.score
-            our_score += play_score
-
-            #
-            outcome = next(
-                outcome
-                for outcome in Outcomes.__iter__()
-                if outcome.symbol == our_letter
-            )
-            our_choice = elve_choice.fulfill(outcome)
-            play_score = outcome.score + our_choice.score
-            secret_score += play_score
 
-            #
-            line = input.readline()
+def score_chunk(data: bytes) -> tp.Tuple[int, int]:
+    # a line cannot be found across two lines, counts are exact
+    counts = [data.count(line) for line in LINE_SCORES]
+    our_scores, secret_scores = zip(*LINE_SCORES.values())
 
-        answers.append((our_score, secret_score))
+    return (
+        sum(map(operator.mul, counts, our_scores)),
+        sum(map(operator.mul, counts, secret_scores)),
+    )
+
+
+def add_scores(
+    left: tp.Tuple[int, int], right: tp.Tuple[int, int]
+) -> tp.Tuple[int, int]:
+    return tuple(map(operator.add, left, right))
+
+
+def parse(input: io.TextIOBase) -> tp.Tuple[int, int]:
+    return utils.reduce_lines(input, score_chunk, add_scores)
+
+
+def solve(inputs: tp.List[io.TextIOBase]):
+    answers = []
+
+    for input in inputs:
+        answers.append(utils.parse_once(input, parse))
 
     yield answers[0][0], None
     yield answers[1][1], None
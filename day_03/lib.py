@@ -1,7 +1,7 @@
 import io
 import string
-import collections
-import itertools
+import functools
+import operator
 import dataclasses
 import typing as tp
 
@@ -9,66 +9,78 @@ import utils
 
 items = string.ascii_lowercase + string.ascii_uppercase
 
+# item at index i is bit i, so priority is the position of the bit + 1
+item_bits = {item: 1 << i for i, item in enumerate(items)}
+
+
+def mask_of(raw: str) -> int:
+    return functools.reduce(operator.or_, map(item_bits.__getitem__, raw), 0)
+
 
 @dataclasses.dataclass
 class ElveRuckSacks:
     raw: str
-    rucksacks: tp.Tuple[tp.Counter[int], tp.Counter[int]]
+    rucksacks: tp.Tuple[int, int]  # item masks
 
-    def unique(self) -> tp.Counter[int]:
-        return collections.Counter(
-            itertools.chain.from_iterable(rs.keys() for rs in self.rucksacks)
-        )
+    def unique(self) -> int:
+        return self.rucksacks[0] | self.rucksacks[1]
 
     @classmethod
-    def from_line(cls, raw: str) -> tp.Tuple["RuckSack", "RuckSack"]:
+    def from_line(cls, raw: str) -> "ElveRuckSacks":
         midpoint = len(raw) // 2
-        rucksacks = [
-            collections.Counter(raw[:midpoint]),
-            collections.Counter(raw[midpoint:]),
-        ]
+        rucksacks = (mask_of(raw[:midpoint]), mask_of(raw[midpoint:]))
         return cls(raw, rucksacks)
 
     @classmethod
-    def duplicate(self, other: "ElveRuckSacks") -> str:
-        return other.unique().most_common(1)[0][0]
+    def duplicate(self, other: "ElveRuckSacks") -> int:
+        return other.rucksacks[0] & other.rucksacks[1]
 
     @classmethod
-    def badge(self, others: tp.List["ElveRuckSacks"]) -> str:
-        allinone = collections.Counter(
-            itertools.chain.from_iterable(
-                elve_rs.unique().keys() for elve_rs in others
-            )
+    def badge(self, others: tp.List["ElveRuckSacks"]) -> int:
+        return functools.reduce(
+            operator.and_, (elve_rs.unique() for elve_rs in others)
         )
-        return allinone.most_common(1)[0][0]
 
 
-def priority_of(item):
-    return items.index(item) + 1
+def priority_of(mask: int) -> int:
+    """Priority of the item of lowest bit set."""
+    return (mask & -mask).bit_length()
 
 
-def solve(inputs: tp.List[io.TextIOBase]):
-    answers = []
+def sum_duplicates(data: bytes) -> int:
+    return sum(
+        priority_of(ElveRuckSacks.duplicate(ElveRuckSacks.from_line(line)))
+        for line in data.decode().split()
+    )
+
+
+def parse(input: io.TextIOBase) -> tp.List[ElveRuckSacks]:
+    elves = []
 
-    for input in inputs:
-        elves = collections.deque()
+    for line in input.readlines():
+        line = line.rstrip("\n")
+        if not line:
+            continue
 
-        for line in input.readlines():
-            line = line.rstrip("\n")
-            if not line:
-                continue
+        rucksacks = ElveRuckSacks.from_line(line)
+        elves.append(rucksacks)
 
-            rucksacks = ElveRuckSacks.from_line(line)
-            elves.append(rucksacks)
+    return elves
 
-        answers.append(elves)
 
-    total_prio = sum(priority_of(ElveRuckSacks.duplicate(elve)) for elve in answers[0])
+def solve(inputs: tp.List[io.TextIOBase]):
+    if utils.in_parallel(inputs[0]):
+        total_prio = utils.reduce_lines(inputs[0], sum_duplicates, operator.add)
+    else:
+        total_prio = sum(
+            priority_of(ElveRuckSacks.duplicate(elve_rs))
+            for elve_rs in utils.parse_once(inputs[0], parse)
+        )
     yield total_prio, None
 
     total_badges = sum(
         priority_of(ElveRuckSacks.badge(group))
-        for i, group in enumerate(utils.group_slice(answers[1], 3))
+        for group in utils.chunks(utils.parse_once(inputs[1], parse), 3)
     )
     yield total_badges, None
 
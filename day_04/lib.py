@@ -1,10 +1,17 @@
 import re
 import io
 import enum
+import array
+import bisect
 import pathlib
+import operator
+import itertools
 import dataclasses
+import collections
 import typing as tp
 
+import utils
+
 
 class Overlap(enum.Enum):
     PARTIAL = 1
@@ -32,29 +39,178 @@ class Range:
         ]
 
 
-def solve(inputs: tp.List[io.TextIOBase]):
-    answers = []
+@dataclasses.dataclass
+class Pairs:
+    """All range pairs of an assignment list, one array per bound."""
+
+    first_starts: array.array
+    first_ends: array.array
+    second_starts: array.array
+    second_ends: array.array
+
+    @classmethod
+    def from_text(cls, text: str) -> "Pairs":
+        bounds = utils.ints(text, signed=False)
+        return cls(bounds[0::4], bounds[1::4], bounds[2::4], bounds[3::4])
+
+    def ranges(self) -> tp.Iterator[Range]:
+        """Both ranges of every pair, in line order."""
+        for first_start, first_end, second_start, second_end in zip(
+            self.first_starts, self.first_ends, self.second_starts, self.second_ends
+        ):
+            yield Range(first_start, first_end)
+            yield Range(second_start, second_end)
+
+    def __len__(self) -> int:
+        return len(self.first_starts)
+
+    def masks(self) -> tp.Tuple[bytes, bytes]:
+        """
+        Per pair, 1 when a range contains the other and 1 when they
+        overlap at all, compared column-wise without any Range.
+        """
+        le, and_ = operator.le, operator.and_
+
+        first_contains = map(
+            and_,
+            map(le, self.first_starts, self.second_starts),
+            map(le, self.second_ends, self.first_ends),
+        )
+        second_contains = map(
+            and_,
+            map(le, self.second_starts, self.first_starts),
+            map(le, self.first_ends, self.second_ends),
+        )
+        complete = bytes(map(operator.or_, first_contains, second_contains))
+
+        overlapping = bytes(
+            map(
+                and_,
+                map(le, self.first_starts, self.second_ends),
+                map(le, self.second_starts, self.first_ends),
+            )
+        )
+
+        return complete, overlapping
+
+    def counts(self) -> tp.Counter[Overlap]:
+        complete, overlapping = self.masks()
+        complete_count = complete.count(1)
+
+        return collections.Counter(
+            {
+                Overlap.COMPLETE: complete_count,
+                Overlap.PARTIAL: overlapping.count(1) - complete_count,
+            }
+        )
 
-    for input in inputs:
-        overlaps = {Overlap.COMPLETE: [], Overlap.PARTIAL: []}
 
-        for line in input.readlines():
-            line = line.rstrip("\n")
-            if not line:
-                continue
+@dataclasses.dataclass
+class _CenteredNode:
+    center: int
+    by_first: tp.List[Range]  # ranges holding center, by first ascending
+    by_last: tp.List[Range]  # same ranges, by last descending
+    left: tp.Optional["_CenteredNode"]
+    right: tp.Optional["_CenteredNode"]
+
+    @classmethod
+    def build(cls, ranges: tp.List[Range]) -> tp.Optional["_CenteredNode"]:
+        if not ranges:
+            return None
+
+        # median bound belongs to a range, so each side gets strictly smaller
+        bounds = sorted(
+            itertools.chain.from_iterable((r.first, r.last) for r in ranges)
+        )
+        center = bounds[len(bounds) // 2]
+
+        left, here, right = [], [], []
+        for range_ in ranges:
+            if range_.last < center:
+                left.append(range_)
+            elif center < range_.first:
+                right.append(range_)
+            else:
+                here.append(range_)
+
+        return cls(
+            center,
+            sorted(here, key=operator.attrgetter("first")),
+            sorted(here, key=operator.attrgetter("last"), reverse=True),
+            cls.build(left),
+            cls.build(right),
+        )
+
+
+class RangeIndex:
+    """
+    Ranges of a whole assignment list, for queries across lines.
+    Sorted bounds answer coverage, a centered interval tree answers stabbing.
+    """
+
+    def __init__(self, ranges: tp.Iterable[Range]):
+        self.ranges = sorted(ranges, key=operator.attrgetter("first"))
+        self._firsts = [r.first for r in self.ranges]
+        self._lasts = sorted(r.last for r in self.ranges)
+        self._root = _CenteredNode.build(self.ranges)
+
+    def __len__(self) -> int:
+        return len(self.ranges)
+
+    def coverage(self, section: int) -> int:
+        """Number of ranges holding the section, in O(log n)."""
+        started = bisect.bisect_right(self._firsts, section)
+        ended = bisect.bisect_left(self._lasts, section)
+        return started - ended
+
+    def stab(self, section: int) -> tp.Iterator[Range]:
+        """Ranges holding the section, in O(log n + k)."""
+        node = self._root
+
+        while node:
+            if section < node.center:
+                yield from itertools.takewhile(
+                    lambda r: r.first <= section, node.by_first
+                )
+                node = node.left
+            elif node.center < section:
+                yield from itertools.takewhile(
+                    lambda r: section <= r.last, node.by_last
+                )
+                node = node.right
+            else:
+                yield from node.by_first
+                return
+
+    def overlapping(self, range_: Range) -> tp.Iterator[Range]:
+        """
+        Ranges sharing a section with the given one, itself included when
+        indexed, in O(log n + k).
+        """
+        # either they hold its first section, or they start within it
+        yield from self.stab(range_.first)
 
-            r1, r2 = line.split(",")
-            first = Range(*map(int, r1.split("-")))
-            second = Range(*map(int, r2.split("-")))
+        lo = bisect.bisect_right(self._firsts, range_.first)
+        hi = bisect.bisect_right(self._firsts, range_.last)
+        yield from self.ranges[lo:hi]
 
-            code = first.overlap_between(second)
-            if code:
-                overlaps[code].append((first, second))
 
-        answers.append(overlaps)
+def count_overlaps(data: bytes) -> tp.Counter[Overlap]:
+    return Pairs.from_text(data.decode()).counts()
+
+
+def parse(input: io.TextIOBase) -> tp.Counter[Overlap]:
+    return utils.reduce_lines(input, count_overlaps, operator.add)
+
+
+def solve(inputs: tp.List[io.TextIOBase]):
+    answers = []
+
+    for input in inputs:
+        answers.append(utils.parse_once(input, parse))
 
-    yield len(answers[0][Overlap.COMPLETE]), None
-    yield len(answers[1][Overlap.PARTIAL]) + len(answers[1][Overlap.COMPLETE]), None
+    yield answers[0][Overlap.COMPLETE], None
+    yield answers[1][Overlap.PARTIAL] + answers[1][Overlap.COMPLETE], None
 
 
 def solve_golf(inputs: tp.List[io.TextIOBase]):
@@ -12,6 +12,21 @@ class Column:
     id: str
     crates: tp.List[str] = dataclasses.field(default_factory=list)
 
+    def take(self, count: int, reverse: bool = False) -> tp.List[str]:
+        """Top crates, lifted as a single run."""
+        assert (
+            0 <= count <= len(self.crates)
+        ), f"cannot take {count} crates out of {len(self.crates)} in {self.id}"
+
+        index = len(self.crates) - count
+        run = self.crates[index:]
+        del self.crates[index:]
+
+        if reverse:
+            run.reverse()
+
+        return run
+
 
 @dataclasses.dataclass
 class Dock:
@@ -30,22 +45,20 @@ class Dock:
 
         return cls({column.id: column for column in columns})
 
-    def apply(self, inst: "Instruction", multiple: bool):
-        start = self.columns[inst.start_id]
-
-        crates = [start.crates.pop() for _ in range(inst.count)]
-        if multiple:
-            crates = reversed(crates)
+    def move(self, count: int, start_id: str, dest_id: str, multiple: bool):
+        # one crate at a time lays the run upside down
+        crates = self.columns[start_id].take(count, reverse=not multiple)
+        self.columns[dest_id].crates.extend(crates)
 
-        dest = self.columns[inst.dest_id]
-        dest.crates.extend(crates)
+    def apply(self, inst: "Instruction", multiple: bool):
+        self.move(inst.count, inst.start_id, inst.dest_id, multiple)
 
     def top_crates(self) -> tp.List[str]:
         return [column.crates[-1] for column in self.columns.values()]
 
 
 re_inst = re.compile(
-    "^move (?P<count>.+) from (?P<start_id>.+) to (?P<dest_id>.+)$"
+    r"move (?P<count>\d+) from (?P<start_id>\d+) to (?P<dest_id>\d+)"
 )
 
 
@@ -57,7 +70,7 @@ class Instruction:
 
     @classmethod
     def from_line(cls, line):
-        match = re_inst.match(line)
+        match = re_inst.fullmatch(line)
         assert match, f"invalid line '{line}'"
         return cls(
             int(match.group("count")),
@@ -65,47 +78,58 @@ class Instruction:
             match.group("dest_id"),
         )
 
+    @staticmethod
+    def fields_of(line: str) -> tp.Tuple[int, str, str]:
+        """Count, start and destination of a move, without any match."""
+        words = line.split()
+        assert (
+            len(words) == 6
+            and words[0] == "move"
+            and words[2] == "from"
+            and words[4] == "to"
+        ), f"invalid line '{line}'"
+        return int(words[1]), words[3], words[5]
 
-def solve(inputs: tp.List[io.TextIOBase]):
-    docks = []
 
-    for input, multiple in zip(inputs, [False, True]):
+def parse(input: io.TextIOBase) -> tp.Tuple[Dock, Dock]:
+    """Final docks of the crane moving one crate at a time, then many."""
+    re_ruler = re.compile("^[0-9 ]*$")
 
-        re_ruler = re.compile("^[0-9 ]*$")
+    lines = (
+        line.rstrip("\n") for line in input if not line.isspace()
+    )
+    docks: tp.Tuple[Dock, Dock] = None
 
-        lines = (
-            line.rstrip("\n") for line in input.readlines() if not line.isspace()
-        )
-        dock: Dock = None
+    # fetch dock status, once per crane
+    rows = collections.deque()
+    for line in lines:
+        match_ruler = re_ruler.match(line)
 
-        # fetch dock status
-        rows = collections.deque()
-        for line in lines:
-            match_ruler = re_ruler.match(line)
+        if match_ruler:
+            docks = (Dock.from_lines(line, rows), Dock.from_lines(line, rows))
+            break
 
-            if match_ruler:
-                dock = Dock.from_lines(line, rows)
-                break
+        rows.append(line)
 
-            rows.append(line)
+    assert docks is not None, "no dock"
 
-        assert dock is not None, "no dock"
+    # apply moves as they are read, both cranes in a single pass
+    for line in lines:
+        count, start_id, dest_id = Instruction.fields_of(line)
+        docks[0].move(count, start_id, dest_id, multiple=False)
+        docks[1].move(count, start_id, dest_id, multiple=True)
 
-        # fetch instructions
-        instructions = collections.deque()
-        for line in lines:
-            inst = Instruction.from_line(line)
-            instructions.append(inst)
+    return docks
 
-        dock = utils.copy(dock=dock)
 
-        for inst in instructions:
-            dock.apply(inst, multiple=multiple)
-        
-        docks.append(dock)
+def solve(inputs: tp.List[io.TextIOBase]):
+    answers = []
+
+    for input in inputs:
+        answers.append(utils.parse_once(input, parse))
 
-    yield "".join(docks[0].top_crates()), None
-    yield "".join(docks[1].top_crates()), None
+    yield "".join(answers[0][0].top_crates()), None
+    yield "".join(answers[1][1].top_crates()), None
 
 
 def solve_golf(inputs: tp.List[io.TextIOBase]):
@@ -1,5 +1,5 @@
 import io
-import collections
+import itertools
 import dataclasses
 import typing as tp
 
@@ -10,33 +10,72 @@ import utils
 class DataStream:
     raw: tp.Iterable[tp.T]
 
+    @classmethod
+    def from_reader(
+        cls, read: tp.Callable[[int], tp.Sequence], size: int = 1 << 16
+    ) -> "DataStream":
+        """Stream of a file, pipe or socket, pulled chunk by chunk."""
+        chunks = itertools.takewhile(bool, map(read, itertools.repeat(size)))
+        return cls(itertools.chain.from_iterable(chunks))
+
+    def starts_of(
+        self, distinct_counts: tp.Iterable[int]
+    ) -> tp.Iterator[tp.Tuple[int, int]]:
+        """
+        Marker length and start of data after it, for all lengths in a single
+        pass, each as soon as found. Memory only grows with distinct symbols.
+        """
+        pending = sorted(set(distinct_counts))
+        last_seen: tp.Dict[tp.T, int] = {}
+        suffix_start = 0  # start of the longest suffix of distinct symbols
+
+        for position, item in enumerate(self.raw):
+            seen = last_seen.get(item, -1)
+            if seen >= suffix_start:
+                suffix_start = seen + 1
+            last_seen[item] = position
+
+            # suffix grows by one at most, shortest markers come first
+            while pending and pending[0] <= position + 1 - suffix_start:
+                yield pending.pop(0), position + 1
+
+            if not pending:
+                return
+
     def start_of(self, distinct_count: int) -> int:
-        for i, seq in enumerate(utils.sliding_window(self.raw, distinct_count)):
-            if len(set(seq)) == distinct_count:
-                return i + distinct_count
-                break
+        for _, start in self.starts_of([distinct_count]):
+            return start
         else:
-            assert False, f"not found within {raw!r}"
+            assert False, f"not found within {self.raw!r}"
 
 
-def solve(inputs: tp.List[io.TextIOBase]):
-    answers = []
+MARKER_LENGTHS = (4, 14)
 
-    for input, length in zip(inputs, [4, 14]):
-        starts = collections.deque()
 
-        for line in input.readlines():
-            line = line.rstrip("\n")
-            if not line:
-                break
+def parse(input: io.TextIOBase) -> tp.List[tp.Dict[int, int]]:
+    """Start of data after each marker length, per datastream line."""
+    starts = []
+
+    for line in input:
+        line = line.rstrip("\n")
+        if not line:
+            break
+
+        found = dict(DataStream(line).starts_of(MARKER_LENGTHS))
+        assert len(found) == len(MARKER_LENGTHS), f"not found within {line!r}"
+        starts.append(found)
+
+    return starts
+
+
+def solve(inputs: tp.List[io.TextIOBase]):
+    answers = []
 
-            ds = DataStream(line)
-            starts.append(ds.start_of(length))
-        
-        answers.append(starts)
+    for input in inputs:
+        answers.append(utils.parse_once(input, parse))
 
-    yield ",".join(map(str, answers[0])), None
-    yield ",".join(map(str, answers[1])), None
+    yield ",".join(str(found[4]) for found in answers[0]), None
+    yield ",".join(str(found[14]) for found in answers[1]), None
 
 
 def solve_golf(inputs: tp.List[io.TextIOBase]):
@@ -3,6 +3,8 @@ import collections
 import dataclasses
 import typing as tp
 
+import utils
+
 
 class FileSystem:
     @dataclasses.dataclass
@@ -99,34 +101,38 @@ class FileSystem:
             nodes.extendleft(current.children())
 
 
+def parse(input: io.TextIOBase) -> FileSystem:
+    fs = FileSystem()
+
+    for line in input.readlines():
+        line = line.rstrip("\n")
+
+        starter = line[0:1]
+        if starter == "$":
+            cmd, _, tail = line[1:].lstrip(" ").partition(" ")
+            if cmd == "cd":
+                path = tail
+                fs.move(path)
+            elif cmd == "ls":
+                pass
+            else:
+                raise RuntimeError("unexpected command")
+        elif starter == "d":
+            _, _, name = line.partition(" ")
+            fs.current.new_folder(name)
+        else:
+            assert starter.isdigit(), "expected file size"
+            size, _, name = line.partition(" ")
+            fs.current.new_file(name, int(size))
+
+    return fs
+
+
 def solve(inputs: tp.List[io.TextIOBase]):
     answers = []
 
     for input in inputs:
-        fs = FileSystem()
-
-        for line in input.readlines():
-            line = line.rstrip("\n")
-
-            starter = line[0:1]
-            if starter == "$":
-                cmd, _, tail = line[1:].lstrip(" ").partition(" ")
-                if cmd == "cd":
-                    path = tail
-                    fs.move(path)
-                elif cmd == "ls":
-                    pass
-                else:
-                    raise RuntimeError("unexpected command")
-            elif starter == "d":
-                _, _, name = line.partition(" ")
-                fs.current.new_folder(name)
-            else:
-                assert starter.isdigit(), "expected file size"
-                size, _, name = line.partition(" ")
-                fs.current.new_file(name, int(size))
-            
-        answers.append(fs)
+        answers.append(utils.parse_once(input, parse))
 
     # Part One
     limit_size = 100000
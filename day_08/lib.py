@@ -12,7 +12,7 @@ class Forest:
 
     @dataclasses.dataclass(unsafe_hash=True)
     class Tree:
-        id: str
+        id: int  # see utils.Names to render it
         height: int
 
     @dataclasses.dataclass()
@@ -29,11 +29,11 @@ class Forest:
     _by_columns: tp.List[tp.List[Tree]]
 
     @classmethod
-    def from_raw(cls, raw: tp.List[tp.List[int]]):
-        make_names = iter(utils.gen_names())
+    def from_raw(cls, raw: tp.Sequence[tp.Sequence[int]]):
+        make_ids = iter(utils.Names().ids())
 
         by_rows = [
-            [cls.Tree(next(make_names), height) for height in line]
+            [cls.Tree(next(make_ids), height) for height in line]
             for line in raw
         ]
         by_columns = list(zip(*by_rows))
@@ -103,19 +103,15 @@ class Forest:
         )
 
 
+def parse(input: io.TextIOBase) -> Forest:
+    return Forest.from_raw(utils.read_digit_grid(input))
+
+
 def solve(inputs: tp.List[io.TextIOBase]):
     forests = []
 
     for input in inputs:
-        raw = []
-        for line in input.readlines():
-            line = line.rstrip("\n")
-            if not line:
-                break
-
-            raw.append([int(x) for x in line])
-
-        forests.append(Forest.from_raw(raw))
+        forests.append(utils.parse_once(input, parse))
 
     yield len(forests[0].all_visible()), None
     yield forests[1].best_scenic().score(), None
@@ -152,16 +152,24 @@ class RopePhysics:
 
         input()
 
+def parse(input: io.TextIOBase) -> tp.List[RopePhysics.Instruction]:
+    instructions = []
+
+    for line in input.readlines():
+        line = line.rstrip("\n")
+        if not line:
+            break
+
+        instructions.append(RopePhysics.Instruction.from_raw(line))
+
+    return instructions
+
+
 def solve(inputs: tp.List[io.TextIOBase]):
     for input, tail_length in zip(inputs, [1, 9]):
         rope = RopePhysics.Rope.create(1 + tail_length)
 
-        for line in input.readlines():
-            line = line.rstrip("\n")
-            if not line:
-                break
-
-            instruction = RopePhysics.Instruction.from_raw(line)
+        for instruction in utils.parse_once(input, parse):
             rope.apply(instruction)
 
             # if tail_length > 2:
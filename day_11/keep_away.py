@@ -56,7 +56,7 @@ def parse_monkey(input: io.TextIOBase) -> Tuple[Monkey, List[IdType]]:
     header = "  Starting items: "
     assert line.startswith(header), "not a valid items line"
 
-    worry_levels = [int(x) for x in line[len(header) :].split(",")]
+    worry_levels = utils.ints(line[len(header) :])
 
     # parse 'Operation: new = old + 6'
     line = input.readline().rstrip("\n")
@@ -104,11 +104,11 @@ def parse_monkey(input: io.TextIOBase) -> Tuple[Monkey, List[IdType]]:
     return monkey, next_ids
 
 
-def play(monkeys: Dict[IdType, Monkey], counters: List[utils.Counter]):
+def play(monkeys: Dict[IdType, Monkey], counters: utils.CounterBank):
     assert len(monkeys) == len(counters)
 
-    for monkey, counter in zip(monkeys.values(), counters):
-        counter.value += len(monkey.worry_levels)
+    for index, monkey in enumerate(monkeys.values()):
+        counters.add(index, len(monkey.worry_levels))
 
         while monkey.worry_levels:
             item = monkey.worry_levels.popleft()
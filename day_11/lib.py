@@ -13,7 +13,7 @@ def solve(inputs: tp.List[io.TextIOBase]):
     for input in inputs:
 
         monkeys = keep_away.parse(input)
-        counters = [utils.Counter() for _ in range(len(monkeys))]
+        counters = utils.CounterBank(len(monkeys))
 
         for i in range(20):
             keep_away.play(monkeys, counters)
@@ -21,8 +21,7 @@ def solve(inputs: tp.List[io.TextIOBase]):
         answers.append(counters)
         break
 
-    top = sorted(answers[0], key=utils.Counter.value.fget, reverse=True)
-    yield (top[:2][0] * top[:2][1]).value, top
+    yield answers[0].product(2), answers[0].top(len(answers[0]))
 
 
 def solve_golf(inputs: tp.List[io.TextIOBase]):
@@ -1,21 +1,164 @@
+import os
+import re
 import sys
 import io
+import json
+import reprlib
+import math
+import pickle
+import hashlib
+import tempfile
+import time
+import statistics
+import cProfile
+import pstats
+import tracemalloc
 import dataclasses
 import pathlib
+import types
 import itertools
 import functools
 import collections
+import collections.abc
 import contextlib
-import pprint
+import importlib.abc
+import importlib.util
+import importlib.machinery
+import concurrent.futures
+import multiprocessing
+import urllib.parse
 import typing as tp
 
 import click
 import requests
 
+import utils
+
 # main folder
 root = pathlib.Path(__file__).parent.resolve()
 
 
+class _LocalLoader(importlib.machinery.SourceFileLoader):
+    """
+    Load a day's helper module under its qualified name (`day_NN.helper`)
+    while keeping it reachable by its bare name during the day's import.
+    """
+
+    def __init__(self, fullname: str, path: str, local_name: str):
+        super().__init__(fullname, path)
+        self.local_name = local_name
+
+    def exec_module(self, module: types.ModuleType):
+        sys.modules[self.local_name] = module
+        super().exec_module(module)
+
+
+class _LocalFinder(importlib.abc.MetaPathFinder):
+    """Find bare imports (`import operation`) within a day's folder."""
+
+    def __init__(self, package: str, path: pathlib.Path):
+        self.package = package
+        self.path = path
+        self.found: tp.List[str] = []
+
+    def find_spec(self, fullname: str, path=None, target=None):
+        source = self.path / f"{fullname}.py"
+        if "." in fullname or not source.is_file():
+            return None
+
+        self.found.append(fullname)
+
+        qualname = f"{self.package}.{fullname}"
+        loader = _LocalLoader(qualname, str(source), fullname)
+        return importlib.util.spec_from_file_location(
+            qualname, source, loader=loader
+        )
+
+
+class DayModules:
+    """
+    Import of day's modules, each day within its own `day_NN` package.
+    Helpers imported by bare name only exist under the day's package,
+    so days never see each other's helpers, whatever the run order.
+    Modules are kept until one of the day's sources changes.
+    """
+
+    def __init__(self):
+        self._loaded: tp.Dict[pathlib.Path, tp.Tuple[tp.Any, types.ModuleType]] = {}
+
+    def load(self, day: "Day") -> types.ModuleType:
+        """Return `lib` module of the day."""
+        stamp = [
+            (source.name, source.stat().st_mtime_ns)
+            for source in sorted(day.path.glob("*.py"))
+        ]
+
+        if day.path in self._loaded:
+            previous, module = self._loaded[day.path]
+            if previous == stamp:
+                return module
+
+        module = self._import(day.path)
+        self._loaded[day.path] = (stamp, module)
+        return module
+
+    def _import(self, path: pathlib.Path) -> types.ModuleType:
+        package = path.name
+
+        # forget any previous load of the day
+        for name in list(sys.modules):
+            if name == package or name.startswith(package + "."):
+                del sys.modules[name]
+
+        init = path / "__init__.py"
+        if init.exists():
+            spec = importlib.util.spec_from_file_location(
+                package, init, submodule_search_locations=[str(path)]
+            )
+        else:
+            spec = importlib.machinery.ModuleSpec(package, None, is_package=True)
+            spec.submodule_search_locations = [str(path)]
+        self._exec(importlib.util.module_from_spec(spec), spec)
+
+        finder = _LocalFinder(package, path)
+        previous = {
+            source.stem: sys.modules[source.stem]
+            for source in path.glob("*.py")
+            if source.stem in sys.modules
+        }
+        sys.meta_path.insert(0, finder)
+
+        try:
+            spec = importlib.util.spec_from_file_location(
+                f"{package}.lib", path / "lib.py"
+            )
+            return self._exec(importlib.util.module_from_spec(spec), spec)
+
+        finally:
+            sys.meta_path.remove(finder)
+
+            # bare names are only meant for the day's own import
+            for name in finder.found:
+                if name in previous:
+                    sys.modules[name] = previous[name]
+                else:
+                    sys.modules.pop(name, None)
+
+    @staticmethod
+    def _exec(module: types.ModuleType, spec) -> types.ModuleType:
+        sys.modules[spec.name] = module
+        if spec.loader is not None:
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[spec.name]
+                raise
+        return module
+
+
+day_modules = DayModules()
+
+
 @dataclasses.dataclass
 class Day:
     """
@@ -51,8 +194,8 @@ class Day:
 
         return day
 
-    def input_url(self) -> str:
-        return f"https://adventofcode.com/2022/day/{self.number}/input"
+    def input_url(self, base_url: str) -> str:
+        return urllib.parse.urljoin(base_url + "/", f"day/{self.number}/input")
 
     def _path_of(self, name: str, example_index: int) -> str:
         # rule for suffix
@@ -75,7 +218,7 @@ class Day:
         Return function by name from day's module.
         Error if not found.
         """
-        module = __import__(self.path.name + ".lib").lib
+        module = day_modules.load(self)
 
         func = getattr(module, name, None)
         assert (
@@ -89,6 +232,34 @@ class Day:
         """Return solve function."""
         return self._import_func("solve_golf" if golf else "solve")
 
+    def parse_func(self) -> tp.Optional[tp.Callable[[io.TextIOBase], tp.Any]]:
+        """Return parse function shared by answers, if any."""
+        return getattr(day_modules.load(self), "parse", None)
+
+
+class InputView(io.StringIO):
+    """
+    Independent and rewindable text view of an input file.
+    Every view of the same file shares its content, read only once,
+    and a table of parsed models (see `utils.parse_once`).
+    """
+
+    def __init__(self, text: str, name: str, models: tp.Dict[tp.Any, tp.Any]):
+        super().__init__(text)
+        self.name = name
+        self.models = models
+
+    @classmethod
+    def open_many(
+        cls, paths: tp.List[pathlib.Path], count: int
+    ) -> tp.List["InputView"]:
+        # read each file once, then repeat it for as many wanted
+        sources = [(path.read_text(), str(path), {}) for path in paths]
+        return [
+            cls(*source)
+            for source in itertools.islice(itertools.cycle(sources), count)
+        ]
+
 
 @dataclasses.dataclass
 class Case:
@@ -97,6 +268,15 @@ class Case:
     golf_answer: bool = False
     example_data: bool = False
 
+    @classmethod
+    def from_situation(cls, day_num: int, situation: tp.Dict[str, bool]):
+        return cls(
+            day_num,
+            None,
+            golf_answer=situation["golf_mode"],
+            example_data=situation["example_run"],
+        )
+
     def about(self, anwser_num: int) -> "Case":
         assert self.anwser_num is None
         return type(self)(
@@ -109,9 +289,20 @@ class Prompt:
     Console output prompt.
     """
 
-    def __init__(self):
+    def __init__(
+        self, infos_depth: int = 3, infos_items: int = 32, infos_size: int = 2000
+    ):
         self._prefix_max_len = 1 + 2 + 3
         self._title_max_len = 10
+        self.infos_depth = infos_depth
+        self.infos_items = infos_items
+        self.infos_size = infos_size
+
+        # builtin leaves are cut too, others are repr'd in full
+        self._leaf_repr = reprlib.Repr()
+        self._leaf_repr.maxstring = infos_size
+        self._leaf_repr.maxlong = infos_size
+        self._leaf_repr.maxother = infos_size
 
     def _prefix(self, case: Case, header: str, *, continue_=False):
         parts = []
@@ -148,7 +339,9 @@ class Prompt:
     def infos(self, case: Case, infos):
         p = self._prefix(case, "infos", continue_=True)
         print(p, "", end="")
-        pprint.pprint(infos)
+        for chunk in self._bounded(infos):
+            sys.stdout.write(chunk)
+        print()
 
     def verified(self, case: Case, result):
         p = self._prefix(case, "valid", continue_=True)
@@ -166,52 +359,380 @@ class Prompt:
         p = self._prefix(case, "error")
         print(p, ": missing", what)
 
+    def bench(self, case: Case, stage: str, stats: "BenchStats"):
+        p = self._prefix(case, "bench", continue_=True)
+        print(
+            p,
+            ">",
+            f"{stage:<6}",
+            f"min {self._duration(stats.min)}",
+            f"median {self._duration(stats.median)}",
+            f"p95 {self._duration(stats.p95)}",
+            f"(x{stats.samples})",
+        )
+
+    def hotspot(self, case: Case, cumulative: float, calls: int, where: str):
+        p = self._prefix(case, "hotspot", continue_=True)
+        print(p, ">", self._duration(cumulative), f"{calls:>9}", where)
+
+    def memory(
+        self, case: Case, stage: str, peak: int, sites: tp.List[tp.Tuple[int, str]]
+    ):
+        p = self._prefix(case, "memory", continue_=True)
+        print(p, ">", f"{stage:<6}", "peak", self._size(peak))
+
+        for size, where in sites:
+            print(p, " ", self._size(size), where)
+
+    def over_limit(self, case: Case, peak: int, limit: int):
+        p = self._prefix(case, "error")
+        print(p, ": memory peak", self._size(peak), "over", self._size(limit))
+
+    def timed_out(self, case: Case, budget: float):
+        p = self._prefix(case, "timeout")
+        print(p, "> killed after", self._duration(budget).strip())
+
+    def fetched(self, case: Case, path: pathlib.Path):
+        p = self._prefix(case, "fetched")
+        print(p, ">", path.relative_to(root) if path.is_relative_to(root) else path)
+
+    def failure(self, case: Case, error: BaseException):
+        p = self._prefix(case, "error")
+        print(p, ":", f"{type(error).__name__}: {error}")
+
+    def _bounded(self, infos) -> tp.Iterable[str]:
+        """
+        Text of infos, cut once over size budget.
+        Rendering is lazy, nothing is formatted past the budget.
+        """
+        shown = 0
+
+        for chunk in self._render(infos, self.infos_depth):
+            if shown + len(chunk) > self.infos_size:
+                yield chunk[: self.infos_size - shown]
+                yield f" ... [truncated after {self.infos_size} chars]"
+                break
+
+            yield chunk
+            shown += len(chunk)
+
+    # rendered as their repr, though sequences
+    _leaves = (str, bytes, bytearray, memoryview, range)
+
+    def _shape(self, target) -> tp.Optional[tp.Tuple[str, str]]:
+        """Brackets of a container, or None for a leaf object."""
+        ttype = type(target)
+        name = ttype.__name__
+
+        if dataclasses.is_dataclass(target) and not isinstance(target, type):
+            return (f"{name}(", ")")
+        elif isinstance(target, collections.abc.Mapping):
+            return ("{", "}") if ttype is dict else (f"{name}({{", "})")
+        elif isinstance(target, collections.abc.Set):
+            return ("{", "}") if ttype is set else (f"{name}({{", "})")
+        elif isinstance(target, tuple):
+            return ("(", ")") if ttype is tuple else (f"{name}(", ")")
+        elif ttype is list:
+            return ("[", "]")
+        elif isinstance(target, collections.abc.Sequence) and not isinstance(
+            target, self._leaves
+        ):
+            return (f"{name}([", "])")
+
+        return None
+
+    def _render(self, target, depth: int) -> tp.Iterable[str]:
+        brackets = self._shape(target)
+
+        if brackets is None:
+            yield self._leaf_repr.repr(target)
+            return
+
+        mapping = isinstance(target, collections.abc.Mapping)
+
+        # dataclasses are walked field by field, like named tuples
+        if dataclasses.is_dataclass(target):
+            fields = [f.name for f in dataclasses.fields(target) if f.repr]
+            items = (getattr(target, name) for name in fields)
+            size = len(fields)
+        else:
+            fields = getattr(target, "_fields", None)
+            items = target.items() if mapping else target
+            size = len(target)
+
+        if depth <= 0:
+            yield f"<{type(target).__name__} of {size}>"
+            return
+
+        opening, closing = brackets
+
+        yield opening
+
+        for index, item in enumerate(items):
+            if index:
+                yield ", "
+
+            if index >= self.infos_items:
+                yield f"... +{size - index} more"
+                break
+
+            if mapping:
+                yield from self._render(item[0], depth - 1)
+                yield ": "
+                yield from self._render(item[1], depth - 1)
+            else:
+                if fields:
+                    yield f"{fields[index]}="
+                yield from self._render(item, depth - 1)
+
+        if type(target) is tuple and len(target) == 1:
+            yield ","
+
+        yield closing
+
+    @staticmethod
+    def _duration(seconds: float) -> str:
+        for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+            if seconds >= scale:
+                break
+        return f"{seconds / scale:7.2f}{unit:<2}"
+
+    @staticmethod
+    def _size(size: int) -> str:
+        for unit, scale in (("GiB", 1 << 30), ("MiB", 1 << 20), ("KiB", 1 << 10)):
+            if size >= scale:
+                break
+        else:
+            unit, scale = "B", 1
+        return f"{size / scale:7.2f}{unit:<3}"
+
+
+class JsonLinesPrompt(Prompt):
+    """
+    Machine readable prompt, one JSON object per line and event.
+    """
+
+    def _emit(self, case: Case, event: str, **fields):
+        record = {"event": event, **dataclasses.asdict(case), **fields}
+        print(json.dumps(record, default=str))
+
+    def title(self, case: Case, title: str):
+        self._emit(case, "title", title=title)
+
+    def result_unchecked(self, case: Case, result):
+        self._emit(case, "unchecked", result=result)
+
+    def infos(self, case: Case, infos):
+        self._emit(case, "infos", infos="".join(self._bounded(infos)))
+
+    def verified(self, case: Case, result):
+        self._emit(case, "valid", result=result)
+
+    def mismatch(self, case: Case, result, expected):
+        self._emit(case, "wrong", result=result, expected=expected)
+
+    def not_implemented(self, case: Case):
+        self._emit(case, "not-implemented")
+
+    def missing(self, case: Case, what: str):
+        self._emit(case, "missing", what=what)
+
+    def bench(self, case: Case, stage: str, stats: "BenchStats"):
+        self._emit(case, "bench", stage=stage, **dataclasses.asdict(stats))
+
+    def hotspot(self, case: Case, cumulative: float, calls: int, where: str):
+        self._emit(case, "hotspot", cumulative=cumulative, calls=calls, where=where)
+
+    def memory(
+        self, case: Case, stage: str, peak: int, sites: tp.List[tp.Tuple[int, str]]
+    ):
+        sites = [{"size": size, "where": where} for size, where in sites]
+        self._emit(case, "memory", stage=stage, peak=peak, sites=sites)
+
+    def over_limit(self, case: Case, peak: int, limit: int):
+        self._emit(case, "over-limit", peak=peak, limit=limit)
+
+    def timed_out(self, case: Case, budget: float):
+        self._emit(case, "timeout", budget=budget)
+
+    def fetched(self, case: Case, path: pathlib.Path):
+        self._emit(case, "fetched", path=path)
+
+    def failure(self, case: Case, error: BaseException):
+        self._emit(case, "error", error=f"{type(error).__name__}: {error}")
+
 
 prompt = Prompt()
 
 
+def use_prompt(new_prompt: Prompt):
+    global prompt
+    prompt = new_prompt
+
+
+@dataclasses.dataclass
+class BenchStats:
+    samples: int
+    min: float
+    median: float
+    p95: float
+
+    @classmethod
+    def from_timings(cls, timings: tp.List[float]) -> "BenchStats":
+        ordered = sorted(timings)
+        # nearest-rank percentile
+        rank = max(0, math.ceil(0.95 * len(ordered)) - 1)
+        return cls(
+            len(ordered), ordered[0], statistics.median(ordered), ordered[rank]
+        )
+
+
+class AnswerCache:
+    """
+    On-disk answers of solvers.
+    Content addressed by the input files and the sources of the day's modules,
+    so any change to one of them is a miss.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+
+    def key(self, day: Day, case: Case, paths: tp.List[pathlib.Path]) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"{day.number}:{case.golf_answer}".encode())
+
+        for path in paths:
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+
+        for source in [*sorted(day.path.glob("*.py")), root / "utils.py"]:
+            digest.update(source.name.encode())
+            digest.update(source.read_bytes())
+
+        return digest.hexdigest()
+
+    def load(self, key: str) -> tp.Optional[tp.List[tp.Tuple[tp.Any, tp.Any]]]:
+        path = self.path / f"{key}.pickle"
+
+        try:
+            with path.open(mode="rb") as ifile:
+                return pickle.load(ifile)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def store(self, key: str, answers: tp.List[tp.Tuple[tp.Any, tp.Any]]):
+        try:
+            data = pickle.dumps(answers)
+        except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+            # some infos are not meant to leave the process
+            return
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        (self.path / f"{key}.pickle").write_bytes(data)
+
+
+@dataclasses.dataclass
+class MemoryWatch:
+    """Settings of memory tracing, sizes are in bytes."""
+
+    top: int = 3
+    limit: tp.Optional[int] = None
+
+
 class Executor:
     """Day's solution execution handler."""
 
-    def __init__(self, day: Day, get_session_cookie):
+    def __init__(
+        self,
+        day: Day,
+        bench: int = 0,
+        cache: tp.Optional[AnswerCache] = None,
+        profile: tp.Optional[pathlib.Path] = None,
+        mem: tp.Optional[MemoryWatch] = None,
+        timeout: tp.Optional[float] = None,
+    ):
         self.day = day
-        self.get_session_cookie = get_session_cookie
+        self.bench = bench
+        self.cache = cache
+        self.profile = profile
+        self.mem = mem
+        self.timeout = timeout
+        self.bench_records: tp.List[tp.Dict[str, tp.Any]] = []
+        # of the case at hand, and of any case solved so far
+        self.failed = False
+        self.any_failed = False
+        self.timed_out = False
+
+    def fail(self):
+        self.failed = self.any_failed = True
 
     def solve(self, example_run: bool, golf_mode: bool):
-        # insert day path to enable local import
-        sys.path.insert(0, str(self.day.path))
+        self.failed = self.timed_out = False
 
-        day_case = Case(
+        day_case = Case.from_situation(
             self.day.number,
-            None,
-            golf_answer=golf_mode,
-            example_data=example_run,
+            {"example_run": example_run, "golf_mode": golf_mode},
         )
 
         expected = self.load_results(day_case)
 
-        create_solver = self.day.solve_func(golf=day_case.golf_answer)
+        paths = self.input_paths(day_case)
 
-        # error, we should have a solver function
-        # but we simply ignore it
-        if create_solver is None:
-            for answer_num, _ in enumerate(expected):
-                prompt.not_implemented(day_case.about(answer_num))
+        # previous answers are replayed without running the solver
+        cache_key, answers = None, None
+        if self.cache is not None:
+            cache_key = self.cache.key(self.day, day_case, paths)
+            answers = self.cache.load(cache_key)
 
-            # clean
-            sys.path.remove(str(self.day.path))
-            return
+        replay = answers is not None
+
+        create_solver = None
+        if not replay or self.bench:
+            create_solver = self.day.solve_func(golf=day_case.golf_answer)
+
+            # error, we should have a solver function
+            # but we simply ignore it
+            if create_solver is None:
+                for answer_num, _ in enumerate(expected):
+                    prompt.not_implemented(day_case.about(answer_num))
+
+                return
 
         with contextlib.ExitStack() as estack:
 
-            ifiles = self.validate_inputs(day_case)
+            if replay:
+                solver = iter(answers)
+            elif self.timeout is not None:
+                solver = self.watched(day_case, paths)
+                answers = []
+            else:
+                if self.mem is not None:
+                    ifiles = self.traced(
+                        day_case, "read", lambda: self.open_inputs(paths)
+                    )
+
+                    # parsing shared by answers is not charged to the first one
+                    parse = None if day_case.golf_answer else self.day.parse_func()
+                    if parse is not None:
+                        self.traced(
+                            day_case, "parse", lambda: self.parse_inputs(parse, ifiles)
+                        )
+                else:
+                    ifiles = self.open_inputs(paths)
+
+                # close all files when done automatically
+                for ifile in ifiles:
+                    estack.enter_context(ifile)
 
-            # close all files when done automatically
-            for ifile in ifiles:
-                estack.enter_context(ifile)
+                # create solver
+                solver = create_solver(ifiles)
+                answers = []
 
-            # create solver
-            solver = create_solver(ifiles)
+                if self.mem is not None:
+                    solver = self.traced_answers(day_case, solver)
+
+                if self.profile is not None:
+                    solver = self.profiled(day_case, solver)
 
             for answer_num, (raw, expect) in enumerate(
                 itertools.zip_longest(solver, expected)
@@ -219,11 +740,18 @@ class Executor:
                 # create case to give to prompt
                 case = day_case.about(answer_num)
 
+                # answers the solver had no time to give, or died before
                 # ignore day if not implemented
                 if raw is None:
-                    prompt.not_implemented(case)
+                    if self.timed_out:
+                        prompt.timed_out(case, self.timeout)
+                    elif not self.failed:
+                        prompt.not_implemented(case)
                     continue
 
+                if not replay:
+                    answers.append(raw)
+
                 # extract result
                 result, infos = raw
 
@@ -252,11 +780,203 @@ class Executor:
                     if infos is not None:
                         prompt.infos(case, infos)
 
-        # clean
-        sys.path.remove(str(self.day.path))
+        # killed past every expected answer, nothing reported yet
+        if self.timed_out and len(answers) >= len(expected):
+            prompt.timed_out(day_case, self.timeout)
 
-    def validate_inputs(self, case: Case, count=2) -> tp.List[io.TextIOBase]:
-        """Check input validity and return read-only file(s) descriptor."""
+        if cache_key is not None and not replay and not self.failed:
+            self.cache.store(cache_key, answers)
+
+        if self.bench and not self.failed:
+            self.benchmark(day_case, create_solver)
+
+    def watched(self, day_case: Case, paths: tp.List[pathlib.Path]) -> tp.Iterable:
+        """
+        Run the solver in a child process, killed once over time budget.
+        Answers yielded in time are forwarded as usual.
+        """
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(
+            target=solve_in_child,
+            args=(sender, self.day, day_case.golf_answer, paths),
+            daemon=True,
+        )
+        process.start()
+        sender.close()
+
+        deadline = time.monotonic() + self.timeout
+
+        try:
+            while True:
+                if not receiver.poll(max(0.0, deadline - time.monotonic())):
+                    # reported along with the missing answers
+                    self.timed_out = True
+                    self.fail()
+                    return
+
+                try:
+                    kind, value = receiver.recv()
+                except EOFError:
+                    process.join()
+                    kind, value = "error", RuntimeError(
+                        f"solver process died with exit code {process.exitcode}"
+                    )
+
+                if kind == "answer":
+                    yield value
+                elif kind == "error":
+                    # reported like a timeout, next cases still run
+                    prompt.failure(day_case, value)
+                    self.fail()
+                    return
+                else:
+                    return
+
+        finally:
+            if process.is_alive():
+                process.kill()
+            process.join()
+            receiver.close()
+
+    def profiled(self, day_case: Case, solver: tp.Iterable) -> tp.Iterable:
+        """
+        Run each answer of the solver under its own profiler,
+        and save statistics aside as `.pstats` file.
+        """
+        solver = iter(solver)
+
+        name = "".join(
+            [
+                f"day_{day_case.day_num:02}",
+                ".golf" * day_case.golf_answer,
+                ".example" * day_case.example_data,
+            ]
+        )
+        self.profile.mkdir(parents=True, exist_ok=True)
+
+        for answer_num in itertools.count():
+            profiler = cProfile.Profile()
+            try:
+                raw = profiler.runcall(solver.__next__)
+            except StopIteration:
+                break
+
+            profiler.dump_stats(self.profile / f"{name}.{answer_num + 1}.pstats")
+            yield raw
+
+    def traced(
+        self, case: Case, stage: str, step: tp.Callable[[], tp.Any]
+    ) -> tp.Any:
+        """
+        Run a step while tracing memory allocations, then report its peak
+        and the top allocation sites still alive at its end.
+        """
+        tracemalloc.start()
+        try:
+            value = step()
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        snapshot = snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            ]
+        )
+        sites = [
+            (stat.size, str(stat.traceback[0]))
+            for stat in snapshot.statistics("lineno")[: self.mem.top]
+        ]
+        prompt.memory(case, stage, peak, sites)
+
+        if self.mem.limit is not None and peak > self.mem.limit:
+            prompt.over_limit(case, peak, self.mem.limit)
+            self.fail()
+
+        return value
+
+    def traced_answers(self, day_case: Case, solver: tp.Iterable) -> tp.Iterable:
+        """Trace memory of each answer of the solver separately."""
+        solver = iter(solver)
+
+        for answer_num in itertools.count():
+            try:
+                raw = self.traced(
+                    day_case.about(answer_num), "answer", solver.__next__
+                )
+            except StopIteration:
+                break
+
+            yield raw
+
+    def benchmark(self, day_case: Case, create_solver):
+        """
+        Time reading the inputs, parsing them and each answer of the solver
+        separately. First round is a warm-up, then `self.bench` rounds are
+        measured. Parsed models are shared (see `utils.parse_once`), so
+        answers only include parsing the solver does not share.
+        """
+        timings = collections.defaultdict(list)
+        exhausted = object()
+        parse = None if day_case.golf_answer else self.day.parse_func()
+
+        for round in range(1 + self.bench):
+            with contextlib.ExitStack() as estack:
+                start = time.perf_counter()
+                ifiles = self.validate_inputs(day_case)
+                for ifile in ifiles:
+                    estack.enter_context(ifile)
+                elapsed = {"read": time.perf_counter() - start}
+
+                if parse is not None:
+                    start = time.perf_counter()
+                    self.parse_inputs(parse, ifiles)
+                    elapsed["parse"] = time.perf_counter() - start
+
+                solver = iter(create_solver(ifiles))
+
+                for answer_num in itertools.count():
+                    start = time.perf_counter()
+                    raw = next(solver, exhausted)
+                    if raw is exhausted:
+                        break
+                    elapsed[answer_num] = time.perf_counter() - start
+
+            # ignore warm-up
+            if round > 0:
+                for stage, duration in elapsed.items():
+                    timings[stage].append(duration)
+
+        for stage, durations in timings.items():
+            if isinstance(stage, int):
+                case, stage = day_case.about(stage), "answer"
+            else:
+                case = day_case
+
+            stats = BenchStats.from_timings(durations)
+            prompt.bench(case, stage, stats)
+
+            self.bench_records.append(
+                {
+                    **dataclasses.asdict(case),
+                    "stage": stage,
+                    **dataclasses.asdict(stats),
+                }
+            )
+
+    @staticmethod
+    def parse_inputs(
+        parse: tp.Callable[[io.TextIOBase], tp.Any], ifiles: tp.List[io.TextIOBase]
+    ):
+        """Parse views ahead of the solver, which then finds the shared models."""
+        for ifile in ifiles:
+            utils.parse_once(ifile, parse)
+            ifile.seek(0)
+
+    def input_paths(self, case: Case, count=2) -> tp.List[pathlib.Path]:
+        """Check input validity and return the distinct input path(s)."""
         paths = []
 
         if case.example_data:
@@ -276,20 +996,23 @@ class Executor:
             # single file expected
             input_path = self.day.input_path()
 
-            if not input_path.exists():
-                self.download_binary(self.day.input_url(), input_path)
-
             if not input_path.exists():
                 prompt.missing(case, f"input file(s)")
                 sys.exit(1)
 
             paths = [input_path]
 
-        # we repeat path for as many wanted
-        return [
-            path.open(mode="r")
-            for path in itertools.islice(itertools.cycle(paths), count)
-        ]
+        return paths
+
+    def open_inputs(
+        self, paths: tp.List[pathlib.Path], count=2
+    ) -> tp.List[io.TextIOBase]:
+        """Return read-only view(s) of the input file(s)."""
+        return InputView.open_many(paths, count)
+
+    def validate_inputs(self, case: Case, count=2) -> tp.List[io.TextIOBase]:
+        """Check input validity and return read-only view(s)."""
+        return self.open_inputs(self.input_paths(case, count), count)
 
     def load_results(self, case: Case) -> tp.List[tp.Dict[str, tp.Any]]:
         """Load result if it exists."""
@@ -306,35 +1029,368 @@ class Executor:
             if line
         ]
 
-    def download_binary(self, url: str, path: pathlib.Path):
-        cookies = dict(session=self.get_session_cookie())
 
-        res = requests.get(url, cookies=cookies)
-        assert res.status_code == 200, res.text
+class Fetcher:
+    """
+    Download of missing real inputs.
+    Files are fetched concurrently over a single pooled session,
+    and only appear once fully written.
+    """
+
+    chunk_size = 1 << 16
+
+    def __init__(self, get_session_cookie, base_url: str, concurrency: int):
+        self.get_session_cookie = get_session_cookie
+        self.base_url = base_url
+        self.concurrency = concurrency
+
+        # temporary files are private, inputs get the usual mode
+        # (umask is read once, before threads may race on it)
+        umask = os.umask(0)
+        os.umask(umask)
+        self.file_mode = 0o666 & ~umask
+
+    @staticmethod
+    def missing(days: tp.Iterable[Day]) -> tp.List[Day]:
+        return [day for day in days if not day.input_path().exists()]
+
+    def fetch(self, days: tp.Iterable[Day]) -> bool:
+        """Download missing inputs, and tell if all of them were."""
+        days = self.missing(days)
+        if not days:
+            return True
+
+        fetched = True
+
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.concurrency
+        )
+
+        with requests.Session() as session:
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.cookies.set("session", self.get_session_cookie())
+
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.concurrency
+            ) as pool:
+                downloads = [
+                    (day, pool.submit(self.download, session, day))
+                    for day in days
+                ]
+
+                for day, future in downloads:
+                    case = Case(day.number, None)
+                    try:
+                        prompt.fetched(case, future.result())
+                    except Exception as error:
+                        prompt.failure(case, error)
+                        fetched = False
+
+        return fetched
+
+    def download(self, session: requests.Session, day: Day) -> pathlib.Path:
+        path = day.input_path()
+
+        with session.get(day.input_url(self.base_url), stream=True) as res:
+            res.raise_for_status()
+
+            # write aside, then move in place at once
+            with tempfile.NamedTemporaryFile(
+                dir=path.parent, prefix=f".{path.name}.", delete=False
+            ) as ofile:
+                try:
+                    for chunk in res.iter_content(chunk_size=self.chunk_size):
+                        ofile.write(chunk)
+                except BaseException:
+                    os.unlink(ofile.name)
+                    raise
+
+        os.chmod(ofile.name, self.file_mode)
+        os.replace(ofile.name, path)
+        return path
+
+
+def solve_in_child(
+    sender, day: Day, golf: bool, paths: tp.List[pathlib.Path]
+):
+    """
+    Body of the watched process, see `Executor.watched`.
+    Every answer is sent back as soon as yielded.
+    """
+    try:
+        solver = day.solve_func(golf=golf)(InputView.open_many(paths, 2))
+
+        for result, infos in solver:
+            try:
+                sender.send(("answer", (result, infos)))
+            except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+                # infos are only displayed, their text is enough
+                sender.send(("answer", (result, repr(infos))))
+
+        sender.send(("done", None))
+
+    except Exception as error:
+        try:
+            sender.send(("error", error))
+        except Exception:
+            sender.send(("error", RuntimeError(f"{type(error).__name__}: {error}")))
+
+    finally:
+        sender.close()
+
+
+# fetch cookie from file and cache it if required
+@functools.lru_cache()
+def get_session_cookie() -> str:
+    return (root / "session_cookie.txt").read_text().rstrip()
+
+
+class DefaultGroup(click.Group):
+    """Group running its default command when no command is named."""
+
+    def __init__(self, *args, default: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.default = default
+
+    def parse_args(self, ctx: click.Context, args: tp.List[str]) -> tp.List[str]:
+        if not args or args[0] not in self.commands and args[0] != "--help":
+            args = [self.default, *args]
+        return super().parse_args(ctx, args)
+
+
+def format_option(func):
+    return click.option(
+        "--format",
+        "output_format",
+        type=click.Choice(["text", "jsonl"]),
+        default="text",
+        show_default=True,
+        help="Console output, human readable or JSON lines.",
+    )(func)
+
+
+def make_prompt(output_format: str, **kwargs) -> Prompt:
+    return {"text": Prompt, "jsonl": JsonLinesPrompt}[output_format](**kwargs)
+
+
+def fetch_options(func):
+    func = click.option(
+        "--base-url",
+        envvar="AOC_BASE_URL",
+        default="https://adventofcode.com/2022",
+        show_default=True,
+        help="Where inputs are downloaded from.",
+    )(func)
+    func = click.option(
+        "--concurrency",
+        type=click.IntRange(1),
+        default=4,
+        show_default=True,
+        help="Maximum number of simultaneous downloads.",
+    )(func)
+    return func
+
+
+def report_hotspots(path: pathlib.Path, days: tp.List[Day], top: int):
+    """Print functions with the most cumulative time, per day."""
+    for day in days:
+        files = sorted(path.glob(f"{day.path.name}.*.pstats"))
+        if not files:
+            continue
+
+        stats = pstats.Stats(*map(str, files))
+        stats.sort_stats(pstats.SortKey.CUMULATIVE)
+
+        # roots have no caller, they are the profiling calls themselves
+        funcs = [func for func in stats.fcn_list if stats.stats[func][4]]
 
-        with path.open(mode="wb") as ofile:
-            for chunk in res.iter_content(chunk_size=128):
-                ofile.write(chunk)
+        case = Case(day.number, None)
+        for func in funcs[:top]:
+            _, calls, _, cumulative, _ = stats.stats[func]
+            prompt.hotspot(case, cumulative, calls, pstats.func_std_string(func))
 
 
-@click.command()
+def parse_size(ctx: click.Context, param: click.Parameter, value: tp.Optional[str]):
+    """Convert sizes such as '512K', '64M' or '1G' into bytes."""
+    if value is None:
+        return None
+
+    match = re.fullmatch(r"(\d+)\s*([KMG]?)(?:i?B)?", value.strip(), re.IGNORECASE)
+    if not match:
+        raise click.BadParameter(f"invalid size {value!r}")
+
+    count, unit = match.groups()
+    return int(count) << {"": 0, "K": 10, "M": 20, "G": 30}[unit.upper()]
+
+
+def select_days(numbers: tp.List[int]) -> tp.List[Day]:
+    return [Day.from_number(number, root) for number in numbers] or list(
+        Day.list_from(root)
+    )
+
+
+def run_case(
+    day: Day,
+    situation: tp.Dict[str, bool],
+    options: tp.Dict[str, tp.Any],
+    output_prompt: Prompt,
+) -> tp.Tuple[str, tp.List[tp.Dict[str, tp.Any]], bool]:
+    """
+    Solve a single case and return everything printed meanwhile,
+    along with benchmark records and whether it failed.
+    Used by worker processes, any failure is reported instead of raised.
+    """
+    use_prompt(output_prompt)
+    executor = Executor(day, **options)
+
+    with io.StringIO() as output:
+        with contextlib.redirect_stdout(output):
+            try:
+                executor.solve(**situation)
+            except (Exception, SystemExit) as error:
+                prompt.failure(Case.from_situation(day.number, situation), error)
+
+        return output.getvalue(), executor.bench_records, executor.any_failed
+
+
+@click.group(cls=DefaultGroup, default="solve")
+def cli():
+    pass
+
+
+@cli.command()
 @click.option("-x", "--example", is_flag=True, help="Run with example data.")
 @click.option("-r", "--real", is_flag=True, help="Run with real data.")
 @click.option("-g", "--golf", is_flag=True, help="Add code golf solution.")
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(1),
+    default=1,
+    help="Number of worker processes to solve cases with.",
+)
+@click.option(
+    "-b",
+    "--bench",
+    type=click.IntRange(0),
+    default=0,
+    help="Time each answer over N rounds, after a warm-up.",
+)
+@click.option(
+    "--bench-output",
+    type=click.Path(dir_okay=False, path_type=pathlib.Path),
+    default=root / "bench.json",
+    show_default=True,
+    help="JSON file receiving benchmark statistics.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Run solvers even if their answers are already cached.",
+)
+@click.option(
+    "-p",
+    "--profile",
+    is_flag=True,
+    help="Profile each answer and report hot spots per day.",
+)
+@click.option(
+    "--profile-dir",
+    type=click.Path(file_okay=False, path_type=pathlib.Path),
+    default=root / "profile",
+    show_default=True,
+    help="Folder receiving .pstats files of each answer.",
+)
+@click.option(
+    "--profile-top",
+    type=click.IntRange(1),
+    default=15,
+    show_default=True,
+    help="Number of functions reported per day.",
+)
+@click.option(
+    "-m",
+    "--mem",
+    is_flag=True,
+    help="Report peak memory and top allocation sites of each answer.",
+)
+@click.option(
+    "--mem-top",
+    type=click.IntRange(0),
+    default=3,
+    show_default=True,
+    help="Number of allocation sites reported.",
+)
+@click.option(
+    "--mem-limit",
+    callback=parse_size,
+    help="Fail cases whose memory peak goes over this size (e.g. 64M).",
+)
+@click.option(
+    "-t",
+    "--timeout",
+    type=click.FloatRange(0, min_open=True),
+    help="Kill cases running longer than this many seconds.",
+)
+@click.option(
+    "--infos-depth",
+    type=click.IntRange(0),
+    default=3,
+    show_default=True,
+    help="Nesting level of infos rendered.",
+)
+@click.option(
+    "--infos-size",
+    type=click.IntRange(1),
+    default=2000,
+    show_default=True,
+    help="Number of characters of infos rendered.",
+)
+@format_option
+@fetch_options
 @click.argument("day", type=click.IntRange(1, 25), nargs=-1)
-def cli(day: tp.List[int], example: bool, real: bool, golf: bool):
+def solve(
+    day: tp.List[int],
+    example: bool,
+    real: bool,
+    golf: bool,
+    jobs: int,
+    bench: int,
+    bench_output: pathlib.Path,
+    no_cache: bool,
+    profile: bool,
+    profile_dir: pathlib.Path,
+    profile_top: int,
+    mem: bool,
+    mem_top: int,
+    mem_limit: tp.Optional[int],
+    timeout: tp.Optional[float],
+    infos_depth: int,
+    infos_size: int,
+    output_format: str,
+    base_url: str,
+    concurrency: int,
+):
+    """Solve days, all of them by default."""
+
+    if timeout is not None and (profile or mem):
+        raise click.UsageError(
+            "--timeout runs solvers in a child process, "
+            "it cannot be combined with --profile or --mem"
+        )
+
+    use_prompt(
+        make_prompt(output_format, infos_depth=infos_depth, infos_size=infos_size)
+    )
 
     if not example and not real:
         example, real = True, True
 
-    # fetch cookie from file and cache it if required
-    @functools.lru_cache()
-    def get_session_cookie() -> str:
-        return (root / "session_cookie.txt").read_text().rstrip()
+    days = select_days(day)
 
-    days: tp.Iterable[Day] = [
-        Day.from_number(number, root) for number in day
-    ] or Day.list_from(root)
+    if real:
+        Fetcher(get_session_cookie, base_url, concurrency).fetch(days)
 
     situations = list(
         itertools.compress(
@@ -347,11 +1403,80 @@ def cli(day: tp.List[int], example: bool, real: bool, golf: bool):
         )
     )
 
-    for day in days:
-        executor = Executor(day, get_session_cookie)
+    # profiling needs solvers to actually run
+    use_cache = not no_cache and not profile and not mem
+
+    options = {
+        "bench": bench,
+        "cache": AnswerCache(root / ".cache" / "answers") if use_cache else None,
+        "profile": profile_dir if profile else None,
+        "mem": MemoryWatch(mem_top, mem_limit) if mem else None,
+        "timeout": timeout,
+    }
+
+    # do not mix statistics with previous runs
+    if profile:
+        for day_ in days:
+            for path in profile_dir.glob(f"{day_.path.name}.*.pstats"):
+                path.unlink()
+
+    bench_records = []
+    failed = False
+
+    if jobs == 1:
+        for day in days:
+            executor = Executor(day, **options)
+
+            for kwargs in situations:
+                executor.solve(**kwargs)
+
+            bench_records.extend(executor.bench_records)
+            failed |= executor.any_failed
+
+    else:
+        # every case goes to the pool, but output is printed in submit order
+        # so days stay sorted whatever the worker finishing first
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+            cases = [
+                (day, kwargs, pool.submit(run_case, day, kwargs, options, prompt))
+                for day in days
+                for kwargs in situations
+            ]
+
+            for day, kwargs, future in cases:
+                try:
+                    output, records, case_failed = future.result()
+                except Exception as error:
+                    # worker died without reporting (crash, killed, ...)
+                    case = Case.from_situation(day.number, kwargs)
+                    prompt.failure(case, error)
+                    failed = True
+                else:
+                    print(output, end="")
+                    bench_records.extend(records)
+                    failed |= case_failed
+
+    if bench:
+        bench_output.write_text(json.dumps(bench_records, indent=2))
+
+    if profile:
+        report_hotspots(profile_dir, days, profile_top)
+
+    if failed:
+        sys.exit(1)
+
+
+@cli.command()
+@format_option
+@fetch_options
+@click.argument("day", type=click.IntRange(1, 25), nargs=-1)
+def prefetch(day: tp.List[int], output_format: str, base_url: str, concurrency: int):
+    """Download missing inputs, of all days by default."""
+    use_prompt(make_prompt(output_format))
+    fetcher = Fetcher(get_session_cookie, base_url, concurrency)
 
-        for kwargs in situations:
-            executor.solve(**kwargs)
+    if not fetcher.fetch(select_days(day)):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,18 @@
+import os
+import re
 import math
+import mmap
+import heapq
+import array
 import itertools
+import functools
 import dataclasses
 import collections
+import collections.abc
 import string
 import operator
+import multiprocessing
+import concurrent.futures
 import typing as tp
 
 
@@ -48,6 +57,56 @@ class Counter:
         return self._op(operator.mul, other)
 
 
+class CounterBank:
+    """
+    Many counters stored in one contiguous array of integers,
+    updated in place without any object per counter.
+    """
+
+    def __init__(self, size: int, typecode: str = "q"):
+        self._values = array.array(typecode, [0]) * size
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> int:
+        return self._values[index]
+
+    def __setitem__(self, index: int, value: int):
+        self._values[index] = value
+
+    def __iter__(self) -> tp.Iterator[int]:
+        return iter(self._values)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._values.tolist()!r})"
+
+    def add(self, index: int, amount: int = 1):
+        self._values[index] += amount
+
+    def add_all(self, amounts: tp.Iterable[int]):
+        """Add to every counter at once, one amount per counter."""
+        values = self._values
+        amounts = array.array(values.typecode, amounts)
+
+        if len(amounts) != len(values):
+            raise RuntimeError(
+                f"expected {len(values)} amounts, not {len(amounts)}"
+            )
+
+        values[:] = array.array(
+            values.typecode, map(operator.add, values, amounts)
+        )
+
+    def top(self, count: int) -> tp.List[int]:
+        """Greatest values, greatest first."""
+        return heapq.nlargest(count, self._values)
+
+    def product(self, count: tp.Optional[int] = None) -> int:
+        """Product of the `count` greatest values, or of all of them."""
+        return math.prod(self._values if count is None else self.top(count))
+
+
 class classproperty(property):
     def __get__(self, owner_self, owner_cls):
         return self.fget(owner_cls)
@@ -71,7 +130,7 @@ def group_slice(
             group.clear()
             group.append(item)
 
-    if group and len(group) != count:
+    if group and len(group) != count and strict:
         raise RuntimeError(
             f"items length is not a multiple of {count}, rest is {len(group)}"
         )
@@ -80,6 +139,82 @@ def group_slice(
         yield tuple(group)
 
 
+class SequenceView(collections.abc.Sequence):
+    """
+    Read-only range of a sequence, items are not copied.
+    """
+
+    __slots__ = ("_items", "_start", "_stop")
+
+    def __init__(self, items: tp.Sequence[tp.T], start: int, stop: int):
+        self._items = items
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        indexes = range(self._start, self._stop)[index]
+        if isinstance(indexes, int):
+            return self._items[indexes]
+        elif indexes.step == 1:
+            return type(self)(self._items, indexes.start, indexes.stop)
+        return [self._items[i] for i in indexes]
+
+    def __iter__(self) -> tp.Iterator[tp.T]:
+        return map(self._items.__getitem__, range(self._start, self._stop))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+def chunks(items: tp.Iterable[tp.T], count: int, strict=True) -> tp.Iterable[tp.T]:
+    """
+    Same groups as `group_slice`, without copying items when possible:
+    - rows of a reshaped array for NumPy arrays,
+    - memoryview slices for buffers (bytes, bytearray, array.array),
+    - `SequenceView` for other sequences.
+    Any other iterable falls back to `group_slice`.
+    Unless strict, the last group may be shorter.
+    """
+    if count <= 0:
+        raise RuntimeError(f"expected positive count, not {count}")
+
+    if isinstance(items, (bytes, bytearray, array.array)):
+        items = memoryview(items)
+    elif not isinstance(items, collections.abc.Sequence) and not hasattr(
+        items, "reshape"
+    ):
+        try:
+            items = memoryview(items)
+        except TypeError:
+            yield from group_slice(items, count, strict=strict)
+            return
+
+    rest = len(items) % count
+    if rest and strict:
+        raise RuntimeError(
+            f"items length is not a multiple of {count}, rest is {rest}"
+        )
+
+    full = len(items) - rest
+
+    if hasattr(items, "reshape"):
+        yield from items[:full].reshape(-1, count)
+        if rest:
+            yield items[full:]
+        return
+
+    if isinstance(items, memoryview):
+        for start in range(0, len(items), count):
+            yield items[start : start + count]
+        return
+
+    for start in range(0, len(items), count):
+        yield SequenceView(items, start, min(start + count, len(items)))
+
+
 def sliding_window(
     items: tp.Iterable[tp.T], count: int, underflow_ok=False
 ) -> tp.Iterable[tp.T]:
@@ -103,63 +238,411 @@ def sliding_window(
         yield tuple(window)
 
 
+class WindowStats:
+    """
+    Running aggregates of a sliding window, updated in place at each step.
+    Sum and extrema are optional, as they need numbers or ordered items.
+    """
+
+    def __init__(self, count: int, sums=False, extrema=False):
+        if count <= 0:
+            raise RuntimeError(f"expected positive count, not {count}")
+
+        self.count = count
+        self.distinct = 0
+        self.sum = 0 if sums else None
+        self._multiplicity: tp.Dict[tp.Any, int] = {}
+        self._items = collections.deque()
+        self._extrema = extrema
+        # monotonic queues of (position, item), first is the extremum
+        self._mins = collections.deque()
+        self._maxs = collections.deque()
+        self._position = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def multiplicity(self, item) -> int:
+        return self._multiplicity.get(item, 0)
+
+    @property
+    def min(self):
+        return self._mins[0][1]
+
+    @property
+    def max(self):
+        return self._maxs[0][1]
+
+    def push(self, item):
+        """Add item at the end of the window, the oldest goes if full."""
+        if len(self._items) == self.count:
+            self._pop()
+
+        self._items.append(item)
+
+        seen = self._multiplicity.get(item, 0)
+        self._multiplicity[item] = seen + 1
+        if not seen:
+            self.distinct += 1
+
+        if self.sum is not None:
+            self.sum += item
+
+        if self._extrema:
+            while self._mins and self._mins[-1][1] >= item:
+                self._mins.pop()
+            self._mins.append((self._position, item))
+
+            while self._maxs and self._maxs[-1][1] <= item:
+                self._maxs.pop()
+            self._maxs.append((self._position, item))
+
+        self._position += 1
+
+    def _pop(self):
+        item = self._items.popleft()
+
+        seen = self._multiplicity[item]
+        if seen == 1:
+            del self._multiplicity[item]
+            self.distinct -= 1
+        else:
+            self._multiplicity[item] = seen - 1
+
+        if self.sum is not None:
+            self.sum -= item
+
+        if self._extrema:
+            oldest = self._position - self.count
+            if self._mins[0][0] == oldest:
+                self._mins.popleft()
+            if self._maxs[0][0] == oldest:
+                self._maxs.popleft()
+
+
+def sliding_stats(
+    items: tp.Iterable[tp.T],
+    count: int,
+    underflow_ok=False,
+    sums=False,
+    extrema=False,
+) -> tp.Iterable[WindowStats]:
+    """
+    Same windows as `sliding_window`, but as running aggregates.
+    The very same `WindowStats` is yielded at each step.
+    """
+    stats = WindowStats(count, sums=sums, extrema=extrema)
+    items = iter(items)
+
+    for item in itertools.islice(items, count):
+        stats.push(item)
+
+    if len(stats) < count and not underflow_ok:
+        raise RuntimeError(
+            f"no window because {count} is greater than elements in {items}"
+        )
+
+    yield stats
+
+    for item in items:
+        stats.push(item)
+        yield stats
+
+
+_re_int = re.compile(r"\d+")
+_re_signed_int = re.compile(r"-?\d+")
+_digits = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+def ints(text: str, signed=True, typecode: str = "q") -> array.array:
+    """
+    All integers of a text, at once.
+    Unsigned mode reads '2-4' as 2 and 4, not 2 and -4.
+    """
+    pattern = _re_signed_int if signed else _re_int
+    return array.array(typecode, map(int, pattern.findall(text)))
+
+
+def read_ints(
+    input: tp.TextIO, signed=True, typecode: str = "q"
+) -> array.array:
+    """All integers of the remaining input, read in one go."""
+    return ints(input.read(), signed=signed, typecode=typecode)
+
+
+def read_blocks(
+    input: tp.TextIO, signed=True, typecode: str = "q"
+) -> tp.List[array.array]:
+    """Integers of the remaining input, per blank-line-separated block."""
+    return [
+        ints(block, signed=signed, typecode=typecode)
+        for block in input.read().split("\n\n")
+        if block and not block.isspace()
+    ]
+
+
+def read_digit_grid(input: tp.TextIO) -> tp.List[bytes]:
+    """
+    Rows of single digits, as bytes where each item is the digit value.
+    """
+    return [
+        row.translate(_digits) for row in input.read().encode("ascii").split()
+    ]
+
+
+def newline_ranges(
+    data: tp.Union[bytes, mmap.mmap], count: int
+) -> tp.List[tp.Tuple[int, int]]:
+    """
+    Split data into about `count` byte ranges, each ending after a newline
+    (but the last), so that no line is shared between two ranges.
+    """
+    if count <= 0:
+        raise RuntimeError(f"expected positive count, not {count}")
+
+    size = len(data)
+    step = max(1, -(-size // count))
+    ranges = []
+
+    start = 0
+    while start < size:
+        stop = data.find(b"\n", min(start + step, size) - 1)
+        stop = size if stop < 0 else stop + 1
+        ranges.append((start, stop))
+        start = stop
+
+    return ranges
+
+
+def _map_range(
+    mapper: tp.Callable[[bytes], tp.T], path: str, start: int, stop: int
+) -> tp.T:
+    with open(path, mode="rb") as ifile:
+        with mmap.mmap(ifile.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return mapper(data[start:stop])
+
+
+def map_reduce_lines(
+    path: tp.Union[str, os.PathLike],
+    mapper: tp.Callable[[bytes], tp.T],
+    reducer: tp.Callable[[tp.T, tp.T], tp.T],
+    workers: tp.Optional[int] = None,
+    chunks_per_worker: int = 4,
+) -> tp.T:
+    """
+    Map newline aligned chunks of a file in a process pool, then reduce
+    partial results in order. Mapper receives the bytes of whole lines,
+    and must be picklable (module level function).
+    """
+    workers = workers or os.cpu_count() or 1
+    path = os.fspath(path)
+
+    if not os.path.getsize(path):
+        return mapper(b"")
+
+    with open(path, mode="rb") as ifile:
+        with mmap.mmap(ifile.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            ranges = newline_ranges(data, workers * chunks_per_worker)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        partials = pool.map(
+            _map_range,
+            itertools.repeat(mapper),
+            itertools.repeat(path),
+            *zip(*ranges),
+        )
+        return functools.reduce(reducer, partials)
+
+
+def _pool_workers(workers: tp.Optional[int]) -> tp.Optional[int]:
+    if multiprocessing.current_process().daemon:
+        return 1  # daemonic processes cannot have children
+    elif workers is None and multiprocessing.parent_process() is not None:
+        return 1  # cores are already shared by the parent's pool
+
+    return workers
+
+
+def in_parallel(
+    input: tp.TextIO,
+    parallel_from: int = 32 << 20,
+    workers: tp.Optional[int] = None,
+) -> bool:
+    """Whether `reduce_lines` maps the input in the process pool."""
+    path = getattr(input, "name", None)
+
+    return (
+        _pool_workers(workers) != 1
+        and isinstance(path, str)
+        and os.path.isfile(path)
+        and os.path.getsize(path) >= parallel_from
+    )
+
+
+def reduce_lines(
+    input: tp.TextIO,
+    mapper: tp.Callable[[bytes], tp.T],
+    reducer: tp.Callable[[tp.T, tp.T], tp.T],
+    parallel_from: int = 32 << 20,
+    workers: tp.Optional[int] = None,
+    **kwargs,
+) -> tp.T:
+    """
+    Map-reduce of `map_reduce_lines` for inputs of solvers, whose lines
+    can be handled independently, so that big inputs use all cores.
+    Only inputs backed by a file of at least `parallel_from` bytes
+    go to the process pool, others are mapped at once in process.
+    Solvers already running in a child process (job pool, watchdog)
+    map in process, unless given `workers`; daemons always do.
+    """
+    if in_parallel(input, parallel_from, workers):
+        return map_reduce_lines(
+            input.name, mapper, reducer, workers=_pool_workers(workers), **kwargs
+        )
+
+    return mapper(input.read().encode())
+
+
+def parse_once(
+    input: tp.TextIO, parse: tp.Callable[[tp.TextIO], tp.T]
+) -> tp.T:
+    """
+    Parse input, or return the model already parsed by another view
+    of the same data. Shared models must be left untouched by solvers.
+    Plain file objects are always parsed.
+    """
+    models = getattr(input, "models", None)
+
+    if models is None:
+        return parse(input)
+
+    if parse not in models:
+        models[parse] = parse(input)
+
+    return models[parse]
+
+
+class Names:
+    """
+    Stable and reversible mapping between indexes and names, shortest names
+    first, then in corpus order: a, ..., z, aa, ab, ..., zz, aaa, ...
+    Names are bijective base-N numbers, so a name is as long as the
+    logarithm of its index, and converting costs as much.
+    Indexes make compact keys, names are only rendered when asked for.
+    Corpus is expected to be made of single characters.
+    """
+
+    def __init__(
+        self, corpus: tp.List[str] = string.ascii_lowercase, min_length: int = 1
+    ):
+        if min_length <= 0:
+            raise RuntimeError(f"expected positive min length, not {min_length}")
+
+        self.corpus = list(corpus)
+        self.min_length = min_length
+        self._positions = {symbol: i for i, symbol in enumerate(self.corpus)}
+
+    def name(self, index: int) -> str:
+        if index < 0:
+            raise IndexError(f"expected positive index, not {index}")
+
+        # skip every name shorter than the wanted one
+        base = len(self.corpus)
+        length = self.min_length
+        while index >= base**length:
+            index -= base**length
+            length += 1
+
+        symbols = collections.deque()
+        for _ in range(length):
+            index, position = divmod(index, base)
+            symbols.appendleft(self.corpus[position])
+
+        return "".join(symbols)
+
+    def index(self, name: str) -> int:
+        if len(name) < self.min_length or any(
+            symbol not in self._positions for symbol in name
+        ):
+            raise KeyError(f"not a generated name {name!r}")
+
+        base = len(self.corpus)
+        shorter = sum(base**length for length in range(self.min_length, len(name)))
+
+        value = 0
+        for symbol in name:
+            value = value * base + self._positions[symbol]
+
+        return shorter + value
+
+    def ids(self, start: int = 0) -> tp.Iterable[int]:
+        return itertools.count(start)
+
+    def names(self, start: int = 0) -> tp.Iterable[str]:
+        return map(self.name, self.ids(start))
+
+
 def gen_names(
     corpus: tp.List[str] = string.ascii_lowercase, min_length: int = 1
 ) -> tp.Iterable[str]:
-    corpus = list(corpus)
-    yield from iter(
-        "".join(
-            next(
-                itertools.islice(
-                    itertools.product(
-                        corpus, repeat=min_length + (x // len(corpus))
-                    ),
-                    x % len(corpus),
-                    x % len(corpus) + 1,
-                )
-            )
-        )
-        for x in itertools.count(0)
-    )
+    yield from Names(corpus, min_length).names()
+
+
+class _CopyFailure(Exception):
+    """Copy error, path to the culprit is gathered while unwinding."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+        self.path = collections.deque()
 
 
 class Copier:
     """
     Deep copy utility with extended support of standard Python object.
     Such as: dataclasses, collections.deque.
+
+    How to copy a type is decided once, then kept as a plan.
+    A memo keeps shared and cyclic references as such in the copy.
+    Dataclasses are rebuilt field by field, without calling `__init__`.
     """
 
-    _immutable = (int, float, bool, str)
+    _immutable = (type(None), int, float, bool, str)
+
+    def __init__(self):
+        self._plans = {}
 
     def __call__(self, **kwargs):
         assert len(kwargs) == 1
         name, target = next(iter(kwargs.items()))
-        return self._copy(target, ((), "=", name))
 
-    def _copy(self, target, path):
-        if target is None:
-            return
+        try:
+            return self._copy(target, {})
+        except _CopyFailure as error:
+            path = ((), "=", name)
+            for access, piece in error.path:
+                path = (path, access, piece)
+            raise RuntimeError(
+                error.message.format(path=self._join_path(path))
+            ) from None
 
-        ttype = type(target)
-        newest = None
+    def _copy(self, target, memo):
+        plan = self._plans.get(type(target))
+        if plan is None:
+            plan = self._plans[type(target)] = self._plan_of(type(target))
 
-        if isinstance(target, self._immutable):
-            newest = target
+        return plan(self, target, memo)
+
+    def _plan_of(self, ttype):
+        if issubclass(ttype, self._immutable):
+            return type(self)._copy_immutable
         elif ttype in self._ctable:
-            newest = self._ctable[ttype](self, target, path)
-        elif dataclasses.is_dataclass(target):
-            newest = self._copy_dataclass(target, path)
+            return self._ctable[ttype]
+        elif dataclasses.is_dataclass(ttype):
+            names = tuple(field.name for field in dataclasses.fields(ttype))
+            return functools.partial(type(self)._copy_dataclass, names=names)
 
-        if type(newest) is ttype:
-            return newest
-        elif newest is None:
-            raise RuntimeError(
-                f"cannot copy instance of {type(target)!r} at '{self._join_path(path)}'"
-            )
-        else:
-            raise RuntimeError(
-                f"expected copied type {type(target)!r}, not {type(newest)!r}"
-            )
+        return type(self)._copy_unknown
 
     def _join_path(self, head_path) -> tp.Optional[str]:
         parts = collections.deque()
@@ -173,40 +656,92 @@ class Copier:
 
         return "".join(parts) or None
 
-    def _iter_index(self, target, path, access="[]"):
-        return (
-            self._copy(item, (path, access, i)) for i, item in enumerate(target)
-        )
+    def _copy_immutable(self, target, memo):
+        return target
 
-    def _iter_key(self, target, path, access="[]"):
-        return (
-            (self._copy(key, path), self._copy(value, (path, access, key)))
-            for key, value in target
+    def _copy_unknown(self, target, memo):
+        raise _CopyFailure(
+            f"cannot copy instance of {type(target)!r} at '{{path}}'"
         )
 
-    def _copy_list(self, target, path):
-        return list(self._iter_index(target, path))
+    def _copy_items(self, target, newest, memo):
+        copy = self._copy
+        append = newest.append
 
-    def _copy_tuple(self, target, path):
-        return tuple(self._iter_index(target, path))
+        try:
+            for item in target:
+                append(copy(item, memo))
+        except _CopyFailure as error:
+            # index of the culprit is the count of items done
+            error.path.appendleft(("[]", len(newest)))
+            raise
 
-    def _copy_queue(self, target, path):
-        return collections.deque(self._iter_index(target, path))
+        return newest
 
-    def _copy_dict(self, target, path):
-        return dict(self._iter_key(target.items(), path))
+    def _copy_list(self, target, memo):
+        if id(target) in memo:
+            return memo[id(target)]
 
-    def _copy_dataclass(self, target, path):
-        members = dict(
-            (
-                self._copy(field.name, (path, ".", field.name)),
-                self._copy(
-                    getattr(target, field.name), (path, ".", field.name)
-                ),
-            )
-            for field in dataclasses.fields(target)
-        )
-        return type(target)(**members)
+        newest = memo[id(target)] = []
+        return self._copy_items(target, newest, memo)
+
+    def _copy_queue(self, target, memo):
+        if id(target) in memo:
+            return memo[id(target)]
+
+        newest = memo[id(target)] = collections.deque(maxlen=target.maxlen)
+        return self._copy_items(target, newest, memo)
+
+    def _copy_tuple(self, target, memo):
+        if id(target) in memo:
+            return memo[id(target)]
+
+        items = self._copy_items(target, [], memo)
+
+        # the tuple may have been reached again through its items
+        if id(target) in memo:
+            return memo[id(target)]
+
+        if all(new is old for new, old in zip(items, target)):
+            newest = target
+        else:
+            newest = tuple(items)
+
+        memo[id(target)] = newest
+        return newest
+
+    def _copy_dict(self, target, memo):
+        if id(target) in memo:
+            return memo[id(target)]
+
+        newest = memo[id(target)] = {}
+        copy = self._copy
+
+        try:
+            for key, value in target.items():
+                newest[copy(key, memo)] = copy(value, memo)
+        except _CopyFailure as error:
+            error.path.appendleft(("[]", key))
+            raise
+
+        return newest
+
+    def _copy_dataclass(self, target, memo, names):
+        if id(target) in memo:
+            return memo[id(target)]
+
+        ttype = type(target)
+        newest = memo[id(target)] = ttype.__new__(ttype)
+        copy = self._copy
+
+        try:
+            for name in names:
+                object.__setattr__(newest, name, copy(getattr(target, name), memo))
+        except _CopyFailure as error:
+            error.path.appendleft((".", name))
+            raise
+
+        return newest
 
     _ctable = {
         list: _copy_list,